@@ -9,14 +9,17 @@ If TIGER/Line download fails after retries, a mock GeoJSON with minimal
 geometry is generated so the frontend remains functional.
 """
 
-import json
 import logging
 import os
+import shutil
 import sys
+import tempfile
 import time
 import zipfile
 
+import orjson
 import requests
+import urllib3
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,11 +40,22 @@ TIGER_DIR = os.path.join(RAW_DIR, "tiger_county")
 MAX_RETRIES = 3
 BACKOFF_BASE = 5
 DOWNLOAD_TIMEOUT = 180
+CHUNK_SIZE = 1024 * 1024  # same as download_census.py
+
+# Geometries encoded to JSON per write_feature_collection block
+GEOJSON_BLOCK = 256
 
 # Target sizes in bytes
 TARGET_SIZE = 3 * 1024 * 1024  # 3 MB ideal
 MAX_SIZE = 5 * 1024 * 1024     # 5 MB hard ceiling
 
+# Douglas-Peucker tolerance bounds (degrees) and the approximate encoded
+# size of one vertex, e.g. "[-86.1234,32.1234]," in compact GeoJSON
+MIN_TOLERANCE = 0.005
+MAX_TOLERANCE = 0.05
+BYTES_PER_VERTEX = 20
+MAX_ATTEMPTS = 3
+
 
 def download_tiger() -> bool:
     """Download TIGER/Line county shapefile with retry logic."""
@@ -59,15 +73,15 @@ def download_tiger() -> bool:
             )
             response = requests.get(TIGER_URL, timeout=DOWNLOAD_TIMEOUT, stream=True)
             if response.status_code == 200:
+                response.raw.decode_content = True  # as iter_content did
                 with open(TIGER_ZIP, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
                 size_mb = os.path.getsize(TIGER_ZIP) / (1024 * 1024)
                 logger.info("Downloaded TIGER shapefile: %.1f MB", size_mb)
                 return True
             else:
                 logger.warning("HTTP %d from TIGER URL", response.status_code)
-        except requests.RequestException as e:
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
             logger.warning(
                 "TIGER download failed (attempt %d/%d): %s",
                 attempt, MAX_RETRIES, e,
@@ -107,30 +121,92 @@ def extract_tiger() -> bool:
         return False
 
 
-def round_coords(coords, precision=4):
-    """Recursively round coordinate values to given decimal precision."""
-    if isinstance(coords, (int, float)):
-        return round(coords, precision)
-    return [round_coords(c, precision) for c in coords]
+def write_feature_collection(f, geoids, names, statefps, geoms) -> tuple[int, int]:
+    """
+    Stream counties to f as a compact FeatureCollection, one feature at a
+    time.
+
+    Geometries are encoded to JSON GEOJSON_BLOCK at a time, so only one
+    block of geometry strings is alive at once. Returns (bytes written,
+    feature count).
+    """
+    import shapely
+
+    size = f.write(b'{"type":"FeatureCollection","features":[')
+    count = 0
+    for start in range(0, len(geoms), GEOJSON_BLOCK):
+        stop = start + GEOJSON_BLOCK
+        # Geometry JSON comes pre-encoded from GEOS; only the small
+        # properties object goes through orjson
+        geometry_strs = shapely.to_geojson(geoms[start:stop])
+        for geoid, name, statefp, geometry_str in zip(
+            geoids[start:stop], names[start:stop], statefps[start:stop], geometry_strs,
+        ):
+            properties = orjson.dumps({
+                "GEOID": geoid,
+                "NAME": name,
+                "STATE": statefp,
+            })
+            size += f.write(
+                (b"," if count else b"")
+                + b'{"type":"Feature","properties":' + properties
+                + b',"geometry":' + geometry_str.encode("utf-8") + b"}"
+            )
+            count += 1
+    size += f.write(b"]}")
+    return size, count
+
 
+def pick_tolerance(geoms, vertex_budget: int, max_iter: int = 8):
+    """
+    Bisect the simplification tolerance so the total vertex count of geoms
+    fits vertex_budget, keeping as much detail as the budget allows.
 
-def geometry_to_dict(geom, precision=4):
-    """Convert a shapely geometry to a GeoJSON-compatible dict with rounded coords."""
+    geoms should already be simplified at MIN_TOLERANCE. Vertex counts come
+    from shapely.get_num_coordinates, so no attempt has to be serialized.
+    Returns (tolerance, simplified geometries). If even MAX_TOLERANCE
+    misses the budget, that over-budget result is returned with a warning.
+    """
     import shapely
-    mapping = shapely.geometry.mapping(geom)
-    mapping["coordinates"] = round_coords(mapping["coordinates"], precision)
-    return mapping
+
+    if shapely.get_num_coordinates(geoms).sum() <= vertex_budget:
+        return MIN_TOLERANCE, geoms
+
+    lo, hi = MIN_TOLERANCE, MAX_TOLERANCE
+    best = shapely.simplify(geoms, hi, preserve_topology=True)
+    coarsest = shapely.get_num_coordinates(best).sum()
+    if coarsest > vertex_budget:
+        logger.warning(
+            "Even tolerance=%.4f leaves %d vertices, over the %d-vertex budget",
+            hi, coarsest, vertex_budget,
+        )
+        return hi, best
+
+    for _ in range(max_iter):
+        if hi / lo < 1.1:
+            break
+        # Vertex counts fall off roughly with log(tolerance), so bisect geometrically
+        mid = (lo * hi) ** 0.5
+        candidate = shapely.simplify(geoms, mid, preserve_topology=True)
+        vertices = shapely.get_num_coordinates(candidate).sum()
+        logger.info("  tolerance=%.4f -> %d vertices (budget %d)", mid, vertices, vertex_budget)
+        if vertices <= vertex_budget:
+            hi, best = mid, candidate
+        else:
+            lo = mid
+    return hi, best
 
 
 def build_geojson_from_shapefile() -> bool:
     """Read shapefile, simplify with shapely, and write compact GeoJSON."""
     try:
         import geopandas as gpd
+        import pyogrio  # noqa: F401 — read_file engine
         import shapely
     except ImportError as e:
         logger.error(
             "Required packages not installed: %s. "
-            "Run: pip install geopandas shapely",
+            "Run: pip install geopandas shapely pyogrio",
             e,
         )
         return False
@@ -147,77 +223,91 @@ def build_geojson_from_shapefile() -> bool:
         return False
 
     logger.info("Reading shapefile: %s", shp_file)
-    gdf = gpd.read_file(shp_file)
-    logger.info("Loaded %d county features", len(gdf))
+    # pyogrio reads through GDAL in bulk; only the columns we emit are loaded,
+    # and the state filter (FIPS 01-56: 50 states + DC) is pushed down to the
+    # driver so territory features are never parsed
+    gdf = gpd.read_file(
+        shp_file,
+        engine="pyogrio",
+        columns=["GEOID", "NAME", "STATEFP"],
+        where="CAST(STATEFP AS integer) BETWEEN 1 AND 56",
+    )
+    logger.info("Loaded %d CONUS+DC county features", len(gdf))
 
-    # Keep only FIPS 01-56 (50 states + DC)
-    conus_states = {str(i).zfill(2) for i in range(1, 57)}
-    gdf = gdf[gdf["STATEFP"].isin(conus_states)].copy()
-    logger.info("Filtered to %d CONUS+DC counties", len(gdf))
+    # Normalize attribute columns once, not per tolerance attempt
+    gdf["GEOID"] = gdf["GEOID"].astype(str).str.zfill(5)
+    gdf["STATEFP"] = gdf["STATEFP"].astype(str).str.zfill(2)
+    gdf["NAME"] = gdf["NAME"].astype(str)
 
     # Ensure CRS is WGS84
     if gdf.crs and gdf.crs.to_epsg() != 4326:
         gdf = gdf.to_crs(epsg=4326)
 
-    # Try increasing simplification tolerance until under target size
-    # Use shapely simplify (Douglas-Peucker) + coordinate rounding
-    tolerances = [0.005, 0.008, 0.01, 0.015, 0.02, 0.03, 0.05]
-    precisions = [4, 4, 4, 4, 3, 3, 3]
+    # Run Douglas-Peucker on the full-resolution polygons only once, at the
+    # finest tolerance; every probe below re-simplifies this much smaller result
+    base = shapely.simplify(gdf.geometry.values, MIN_TOLERANCE, preserve_topology=True)
+
+    # Pick the tolerance from a vertex budget instead of sweeping tolerances
+    # and serializing each one; re-serialize only if the size estimate misses
+    vertex_budget = TARGET_SIZE // BYTES_PER_VERTEX
+    best = None
 
-    for tolerance, precision in zip(tolerances, precisions):
+    for _ in range(MAX_ATTEMPTS):
+        tolerance, simplified = pick_tolerance(base, vertex_budget)
+        # Coarse tolerances don't need 4-decimal coordinates
+        precision = 4 if tolerance < 0.02 else 3
         logger.info("Simplifying with tolerance=%.4f, precision=%d...", tolerance, precision)
 
-        features = []
-        for _, row in gdf.iterrows():
-            geoid = str(row.get("GEOID", "")).zfill(5)
-            name = str(row.get("NAME", ""))
-            statefp = str(row.get("STATEFP", geoid[:2]))
-
-            simplified_geom = row.geometry.simplify(tolerance, preserve_topology=True)
-            if simplified_geom.is_empty:
-                continue
-
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "GEOID": geoid,
-                    "NAME": name,
-                    "STATE": statefp,
-                },
-                "geometry": geometry_to_dict(simplified_geom, precision),
-            }
-            features.append(feature)
-
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features,
-        }
-
-        # Use separators to minimize whitespace
-        geojson_str = json.dumps(geojson, separators=(",", ":"))
-        size_bytes = len(geojson_str.encode("utf-8"))
+        # Snap coordinates to the precision grid in GEOS, which also drops
+        # vertices that collapse onto the same grid cell
+        snapped = shapely.set_precision(simplified, 10 ** -precision)
+        keep = ~shapely.is_empty(snapped)
+
+        # Encode and stream features block by block into a spooled buffer
+        # (spills to disk past MAX_SIZE) instead of holding every geometry
+        # string, a features list and the joined document at once
+        spool = tempfile.SpooledTemporaryFile(max_size=MAX_SIZE)
+        size_bytes, feature_count = write_feature_collection(
+            spool,
+            gdf.loc[keep, "GEOID"].tolist(),
+            gdf.loc[keep, "NAME"].tolist(),
+            gdf.loc[keep, "STATEFP"].tolist(),
+            snapped[keep],
+        )
         size_mb = size_bytes / (1024 * 1024)
         logger.info(
             "Result: %.2f MB (%d features) [tolerance=%.4f, precision=%d]",
-            size_mb, len(features), tolerance, precision,
+            size_mb, feature_count, tolerance, precision,
         )
 
         if size_bytes <= MAX_SIZE:
-            if size_bytes > TARGET_SIZE:
-                logger.warning(
-                    "GeoJSON is %.2f MB — above 3 MB target but below 5 MB ceiling",
-                    size_mb,
-                )
-            os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-            with open(OUTPUT_PATH, "w") as f:
-                f.write(geojson_str)
-            logger.info("Wrote counties.geojson: %.2f MB (%d features)", size_mb, len(features))
-            return True
-
-        logger.info("File too large (%.2f MB), trying more aggressive simplification...", size_mb)
-
-    logger.error("Could not simplify GeoJSON below 5 MB ceiling after multiple attempts")
-    return False
+            best = (spool, size_bytes, feature_count)
+            break
+
+        spool.close()
+        if tolerance >= MAX_TOLERANCE:
+            break
+        # Shrink the budget by the overshoot and try again
+        vertex_budget = int(vertex_budget * TARGET_SIZE / size_bytes)
+        logger.info("File too large (%.2f MB), retrying with a %d-vertex budget...", size_mb, vertex_budget)
+
+    if best is None:
+        logger.error("Could not simplify GeoJSON below 5 MB ceiling after multiple attempts")
+        return False
+
+    spool, size_bytes, feature_count = best
+    size_mb = size_bytes / (1024 * 1024)
+    if size_bytes > TARGET_SIZE:
+        logger.warning(
+            "GeoJSON is %.2f MB — above 3 MB target but below 5 MB ceiling",
+            size_mb,
+        )
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    with spool, open(OUTPUT_PATH, "wb") as f:
+        spool.seek(0)
+        shutil.copyfileobj(spool, f)
+    logger.info("Wrote counties.geojson: %.2f MB (%d features)", size_mb, feature_count)
+    return True
 
 
 def generate_mock_geojson():
@@ -228,8 +318,8 @@ def generate_mock_geojson():
     demo_path = os.path.join(PROJECT_DIR, "public", "data", "demographics", "counties.json")
     counties = {}
     if os.path.exists(demo_path):
-        with open(demo_path, "r") as f:
-            counties = json.load(f)
+        with open(demo_path, "rb") as f:
+            counties = orjson.loads(f.read())
 
     # State FIPS to approximate centroids (lon, lat) for mock points
     state_centroids = {
@@ -289,8 +379,8 @@ def generate_mock_geojson():
     }
 
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(geojson, f)
+    with open(OUTPUT_PATH, "wb") as f:
+        f.write(orjson.dumps(geojson))
 
     size_kb = os.path.getsize(OUTPUT_PATH) / 1024
     logger.info(
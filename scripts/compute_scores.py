@@ -16,17 +16,22 @@ Counties with zero establishments get a capped maximum raw score
 
 Input:
   scripts/processed/cbp_by_industry.json
+  scripts/processed/acs_demographics.parquet (preferred, if present)
   scripts/processed/acs_demographics.json
   public/data/industries.json
 Output:
   public/data/scores/{industry-id}.json (one per industry)
 """
 
-import json
 import logging
+import multiprocessing
 import os
 import sys
 
+import numpy as np
+import orjson
+import pandas as pd
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -42,6 +47,7 @@ DEMOGRAPHICS_PATH = os.path.join(PROJECT_DIR, "public", "data", "demographics",
 
 CBP_PATH = os.path.join(PROCESSED_DIR, "cbp_by_industry.json")
 ACS_PATH = os.path.join(PROCESSED_DIR, "acs_demographics.json")
+ACS_PARQUET_PATH = os.path.join(PROCESSED_DIR, "acs_demographics.parquet")
 
 # State FIPS to abbreviation (same as process_acs.py)
 STATE_FIPS_TO_ABBR = {
@@ -61,6 +67,9 @@ STATE_FIPS_TO_ABBR = {
 # County names from CBP data (FIPS -> name), populated from demographics
 COUNTY_NAMES = {}
 
+# Shared inputs for pool workers, set once per process by _init_worker
+_worker_inputs = {}
+
 
 def normalize_values(values: list[float]) -> list[float]:
     """Min-max normalize a list of values to [0, 1]."""
@@ -75,202 +84,275 @@ def normalize_values(values: list[float]) -> list[float]:
 
 def normalize_scores(raw_scores: list[float]) -> list[float]:
     """Min-max normalize raw scores to [0, 100] range."""
-    if not raw_scores:
+    raw = np.asarray(raw_scores, dtype=float)
+    if raw.size == 0:
         return []
-    min_val = min(raw_scores)
-    max_val = max(raw_scores)
+    min_val = raw.min()
+    max_val = raw.max()
     if max_val == min_val:
-        return [50.0] * len(raw_scores)
-    return [
-        round((v - min_val) / (max_val - min_val) * 100)
-        for v in raw_scores
-    ]
+        return [50.0] * raw.size
+    return np.rint((raw - min_val) / (max_val - min_val) * 100).astype(int).tolist()
 
 
 def compute_capped_score(pop_per_biz_values: list[float]) -> float:
     """Compute the cap for zero-establishment counties (95th percentile)."""
-    if not pop_per_biz_values:
+    values = np.asarray(pop_per_biz_values, dtype=float)
+    if values.size == 0:
         return 1.0
-    sorted_vals = sorted(pop_per_biz_values)
-    idx = int(len(sorted_vals) * 0.95)
-    idx = min(idx, len(sorted_vals) - 1)
-    return sorted_vals[idx]
+    # Linear-time selection of the k-th smallest value; no full sort needed
+    idx = min(int(values.size * 0.95), values.size - 1)
+    return float(np.partition(values, idx)[idx])
+
+
+def build_county_arrays(demographics: dict | pd.DataFrame) -> dict:
+    """
+    Flatten demographics into aligned NumPy arrays over valid county FIPS.
+
+    demographics is either the FIPS-keyed dict from acs_demographics.json or
+    the columnar frame from acs_demographics.parquet.
+
+    Built once in main and shared by every industry so scoring runs as
+    array arithmetic instead of per-county dict lookups. The income and
+    growth normalization bounds depend only on demographics, so they are
+    computed here once as well; compute_industry_scores widens the growth
+    bounds per industry for CBP-only counties.
+    """
+    if isinstance(demographics, pd.DataFrame):
+        fips_col = demographics["fips"]
+        frame = demographics[
+            (fips_col.str.len() == 5) & fips_col.str[:2].isin(list(STATE_FIPS_TO_ABBR))
+        ]
+        fips_list = frame["fips"].tolist()
+        population = frame["population"].to_numpy(dtype=float)
+        income = frame["medianIncome"].to_numpy(dtype=float)
+        growth = frame["populationGrowth"].to_numpy(dtype=float)
+        names = frame["name"].to_numpy(dtype=object)
+        states = frame["state"].to_numpy(dtype=object)
+    else:
+        fips_list = [f for f in demographics if len(f) == 5 and f[:2] in STATE_FIPS_TO_ABBR]
+        demos = [demographics[f] for f in fips_list]
+        population = np.array([d.get("population", 0) for d in demos], dtype=float)
+        income = np.array([d.get("medianIncome", 0) for d in demos], dtype=float)
+        growth = np.array([d.get("populationGrowth", 0) for d in demos], dtype=float)
+        names = np.array([d.get("name", "") for d in demos], dtype=object)
+        states = np.array(
+            [d.get("state", STATE_FIPS_TO_ABBR.get(f[:2], "")) for f, d in zip(fips_list, demos)],
+            dtype=object,
+        )
+
+    # Normalize income (ignoring missing/zero incomes) and growth across all counties
+    incomes = income[income > 0]
+    income_min = incomes.min() if incomes.size else 0
+    income_max = incomes.max() if incomes.size else 1
+    growth_min = growth.min() if growth.size else 0
+    growth_max = growth.max() if growth.size else 1
+
+    return {
+        "fips": np.array(fips_list, dtype=object),
+        "fips_set": frozenset(fips_list),
+        "population": population,
+        "income": income,
+        "growth": growth,
+        "name": names,
+        "state": states,
+        "income_min": income_min,
+        "income_range": income_max - income_min if income_max != income_min else 1,
+        "growth_min": growth_min,
+        "growth_max": growth_max,
+    }
 
 
 def compute_industry_scores(
     industry_id: str,
     cbp_data: dict,
-    demographics: dict,
+    demographics: dict | pd.DataFrame,
+    county_arrays: dict | None = None,
 ) -> dict:
     """
     Compute opportunity scores for one industry.
 
+    county_arrays is the output of build_county_arrays(demographics); it is
+    built on the fly when not supplied.
+
     Returns: Record<fips, CountyScore> matching the TypeScript interface.
     """
     establishment_counts = cbp_data.get(industry_id, {})
 
-    if not establishment_counts and not demographics:
+    if not establishment_counts and len(demographics) == 0:
         logger.warning("No data for industry %s — skipping", industry_id)
         return {}
 
-    # Gather all FIPS codes from both sources
-    all_fips = set(establishment_counts.keys()) | set(demographics.keys())
-    # Filter to valid county FIPS (5 digits, state <= 56 to exclude territories beyond PR)
-    all_fips = {f for f in all_fips if len(f) == 5 and f[:2] in STATE_FIPS_TO_ABBR}
+    if county_arrays is None:
+        county_arrays = build_county_arrays(demographics)
 
-    if not all_fips:
+    # county_arrays["fips"] is already restricted to valid county FIPS
+    fips = county_arrays["fips"]
+    # Valid FIPS present only in CBP have no population and are never
+    # scored, but they still enter the growth range as zero growth. The set
+    # difference leaves only those few keys to validate.
+    has_cbp_only = any(
+        len(f) == 5 and f[:2] in STATE_FIPS_TO_ABBR
+        for f in set(establishment_counts).difference(county_arrays["fips_set"])
+    )
+
+    if len(fips) == 0:
         logger.warning("No valid FIPS for industry %s", industry_id)
         return {}
 
-    # Collect income and growth values for normalization
-    incomes = []
-    growths = []
-    for fips in all_fips:
-        demo = demographics.get(fips, {})
-        income = demo.get("medianIncome", 0)
-        growth = demo.get("populationGrowth", 0)
-        if income > 0:
-            incomes.append(income)
-        growths.append(growth)
-
-    # Normalize income and growth across all counties
-    income_min = min(incomes) if incomes else 0
-    income_max = max(incomes) if incomes else 1
-    income_range = income_max - income_min if income_max != income_min else 1
-
-    growth_min = min(growths) if growths else 0
-    growth_max = max(growths) if growths else 1
+    pop = county_arrays["population"]
+    income = county_arrays["income"]
+    growth = county_arrays["growth"]
+    income_min = county_arrays["income_min"]
+    income_range = county_arrays["income_range"]
+    growth_min = county_arrays["growth_min"]
+    growth_max = county_arrays["growth_max"]
+    if has_cbp_only:
+        growth_min, growth_max = min(growth_min, 0.0), max(growth_max, 0.0)
     growth_range = growth_max - growth_min if growth_max != growth_min else 1
-
-    # Compute pop/biz for non-zero establishment counties
-    pop_per_biz_nonzero = []
-    for fips in all_fips:
-        demo = demographics.get(fips, {})
-        pop = demo.get("population", 0)
-        est = establishment_counts.get(fips, 0)
-        if est > 0 and pop > 0:
-            pop_per_biz_nonzero.append(pop / est)
-
-    cap = compute_capped_score(pop_per_biz_nonzero)
-
-    # Compute raw scores
-    county_raw = {}
-    county_info = {}
-    for fips in all_fips:
-        demo = demographics.get(fips, {})
-        pop = demo.get("population", 0)
-        est = establishment_counts.get(fips, 0)
-        income = demo.get("medianIncome", 0)
-        growth = demo.get("populationGrowth", 0)
-        name = demo.get("name", "")
-        state = demo.get("state", STATE_FIPS_TO_ABBR.get(fips[:2], ""))
-
-        if pop <= 0:
-            continue
-
-        # Pop per biz ratio (capped for zero establishments)
-        if est > 0:
-            pop_per_biz = pop / est
-        else:
-            pop_per_biz = cap  # Capped score for zero-establishment counties
-
-        # Income weight: 1.0 + 0.3 * normalize(income)
-        norm_income = (income - income_min) / income_range if income > 0 else 0.0
-        income_weight = 1.0 + 0.3 * norm_income
-
-        # Growth weight: 1.0 + 0.2 * normalize(growth)
-        norm_growth = (growth - growth_min) / growth_range
-        growth_weight = 1.0 + 0.2 * norm_growth
-
-        raw = pop_per_biz * income_weight * growth_weight
-
-        county_raw[fips] = raw
-        county_info[fips] = {
-            "name": name,
-            "state": state,
-            "est": est,
-            "pop_per_biz": round(pop_per_biz),
-        }
-
-    if not county_raw:
+    est = np.fromiter(
+        (establishment_counts.get(f, 0) for f in fips),
+        dtype=np.int64,
+        count=len(fips),
+    )
+
+    # Cap for zero-establishment counties from pop/biz of non-zero counties
+    nonzero = (est > 0) & (pop > 0)
+    cap = compute_capped_score(pop[nonzero] / est[nonzero])
+
+    scored = pop > 0
+    if not scored.any():
         logger.warning("No counties with valid data for %s", industry_id)
         return {}
 
+    pop = pop[scored]
+    est = est[scored]
+    income = income[scored]
+    growth = growth[scored]
+
+    # Pop per biz ratio (capped for zero establishments)
+    pop_per_biz = np.where(est > 0, pop / np.maximum(est, 1), cap)
+
+    # Income weight: 1.0 + 0.3 * normalize(income)
+    norm_income = np.where(income > 0, (income - income_min) / income_range, 0.0)
+    income_weight = 1.0 + 0.3 * norm_income
+
+    # Growth weight: 1.0 + 0.2 * normalize(growth)
+    norm_growth = (growth - growth_min) / growth_range
+    growth_weight = 1.0 + 0.2 * norm_growth
+
+    raw = pop_per_biz * income_weight * growth_weight
+
     # Normalize to 0-100
-    fips_list = list(county_raw.keys())
-    raw_list = [county_raw[f] for f in fips_list]
-    normalized = normalize_scores(raw_list)
+    normalized = normalize_scores(raw)
 
     # Build output matching CountyScore TypeScript interface
     result = {}
-    for fips, score in zip(fips_list, normalized):
-        info = county_info[fips]
-        result[fips] = {
-            "fips": fips,
-            "name": info["name"],
-            "state": info["state"],
+    for f, name, state, score, est_count, per_biz in zip(
+        fips[scored].tolist(),
+        county_arrays["name"][scored].tolist(),
+        county_arrays["state"][scored].tolist(),
+        normalized,
+        est.tolist(),
+        np.rint(pop_per_biz).astype(np.int64).tolist(),
+    ):
+        result[f] = {
+            "fips": f,
+            "name": name,
+            "state": state,
             "score": score,
-            "establishmentCount": info["est"],
-            "populationPerBiz": info["pop_per_biz"],
+            "establishmentCount": est_count,
+            "populationPerBiz": per_biz,
         }
 
     return result
 
 
+def _init_worker(cbp_data: dict, demographics: dict | pd.DataFrame, county_arrays: dict):
+    """Pool initializer: keep the shared inputs in the worker process."""
+    _worker_inputs["cbp_data"] = cbp_data
+    _worker_inputs["demographics"] = demographics
+    _worker_inputs["county_arrays"] = county_arrays
+
+
+def _compute_and_write(industry_id: str, output_path: str) -> tuple[str, int, str]:
+    """Compute one industry's scores in a pool worker and write its JSON file."""
+    scores = compute_industry_scores(
+        industry_id,
+        _worker_inputs["cbp_data"],
+        _worker_inputs["demographics"],
+        _worker_inputs["county_arrays"],
+    )
+    # Compact output: score files are only consumed by the frontend
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(scores))
+    return industry_id, len(scores), output_path
+
+
 def main():
     os.makedirs(SCORES_DIR, exist_ok=True)
 
     # Load industries
-    with open(INDUSTRIES_PATH, "r") as f:
-        industries = json.load(f)
+    with open(INDUSTRIES_PATH, "rb") as f:
+        industries = orjson.loads(f.read())
     logger.info("Loaded %d industries", len(industries))
 
     # Load CBP data
     if not os.path.exists(CBP_PATH):
         logger.error("CBP data not found at %s. Run process_cbp.py first.", CBP_PATH)
         sys.exit(1)
-    with open(CBP_PATH, "r") as f:
-        cbp_data = json.load(f)
+    with open(CBP_PATH, "rb") as f:
+        cbp_data = orjson.loads(f.read())
     logger.info("Loaded CBP data: %d industries", len(cbp_data))
 
-    # Load ACS demographics (may be empty if Census download failed)
+    # Load ACS demographics (may be empty if Census download failed).
+    # Prefer the columnar Parquet copy unless the JSON was written after it.
     demographics = {}
-    if os.path.exists(ACS_PATH):
-        with open(ACS_PATH, "r") as f:
-            demographics = json.load(f)
+    if os.path.exists(ACS_PARQUET_PATH) and (
+        not os.path.exists(ACS_PATH)
+        or os.path.getmtime(ACS_PARQUET_PATH) >= os.path.getmtime(ACS_PATH)
+    ):
+        try:
+            demographics = pd.read_parquet(ACS_PARQUET_PATH)
+        except ImportError as e:
+            logger.info("Cannot read %s (%s), using JSON instead", ACS_PARQUET_PATH, e)
+    if len(demographics) == 0 and os.path.exists(ACS_PATH):
+        with open(ACS_PATH, "rb") as f:
+            demographics = orjson.loads(f.read())
     logger.info("Loaded ACS demographics: %d counties", len(demographics))
 
     # If ACS data is empty, try using the existing demographics file
-    if not demographics and os.path.exists(DEMOGRAPHICS_PATH):
+    if len(demographics) == 0 and os.path.exists(DEMOGRAPHICS_PATH):
         logger.info("ACS processed data empty, falling back to existing demographics file")
-        with open(DEMOGRAPHICS_PATH, "r") as f:
-            demographics = json.load(f)
+        with open(DEMOGRAPHICS_PATH, "rb") as f:
+            demographics = orjson.loads(f.read())
         logger.info("Loaded fallback demographics: %d counties", len(demographics))
 
-    if not demographics:
+    if len(demographics) == 0:
         logger.warning(
             "No demographics data available. "
             "Scores will use establishment counts only (no income/growth weighting). "
             "Run download_census.py and process_acs.py to get full scoring."
         )
 
-    # Compute scores for each industry
-    total_written = 0
-    for industry in industries:
-        industry_id = industry["id"]
-        scores = compute_industry_scores(industry_id, cbp_data, demographics)
-
-        output_path = os.path.join(SCORES_DIR, f"{industry_id}.json")
-        with open(output_path, "w") as f:
-            json.dump(scores, f, indent=2)
+    # Compute scores for each industry in parallel; the shared inputs are
+    # handed to each worker once instead of being pickled with every task
+    tasks = [
+        (industry["id"], os.path.join(SCORES_DIR, f"{industry['id']}.json"))
+        for industry in industries
+    ]
+    with multiprocessing.Pool(
+        initializer=_init_worker,
+        initargs=(cbp_data, demographics, build_county_arrays(demographics)),
+    ) as pool:
+        results = pool.starmap(_compute_and_write, tasks)
 
+    for industry_id, county_count, output_path in results:
         logger.info(
             "  %s: %d counties scored -> %s",
-            industry_id, len(scores), output_path,
+            industry_id, county_count, output_path,
         )
-        total_written += 1
 
-    logger.info("Wrote %d industry score files to %s", total_written, SCORES_DIR)
+    logger.info("Wrote %d industry score files to %s", len(results), SCORES_DIR)
 
 
 if __name__ == "__main__":
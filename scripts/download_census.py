@@ -4,10 +4,14 @@ Download County Business Patterns (CBP) and American Community Survey (ACS)
 """
 
 import os
+import shutil
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+import urllib3
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +45,7 @@ DOWNLOADS = {
 
 MAX_RETRIES = 3
 BACKOFF_BASE = 5  # seconds
+CHUNK_SIZE = 1024 * 1024  # 1 MB copy buffer for streamed downloads
 
 
 def download_file(url: str, dest_path: str, description: str) -> bool:
@@ -54,9 +59,11 @@ def download_file(url: str, dest_path: str, description: str) -> bool:
             response = requests.get(url, timeout=120, stream=True)
 
             if response.status_code == 200:
+                # Copy the raw stream to disk in 1 MB C-level reads; decode_content
+                # keeps transparent gzip/deflate handling that iter_content provided
+                response.raw.decode_content = True
                 with open(dest_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=CHUNK_SIZE)
                 file_size = os.path.getsize(dest_path)
                 logger.info(
                     "Successfully downloaded %s (%d bytes) -> %s",
@@ -68,7 +75,7 @@ def download_file(url: str, dest_path: str, description: str) -> bool:
                     "HTTP %d for %s from URL: %s",
                     response.status_code, description, url,
                 )
-        except requests.RequestException as e:
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
             logger.warning(
                 "Request failed for %s (attempt %d/%d): %s | URL: %s",
                 description, attempt, MAX_RETRIES, e, url,
@@ -103,26 +110,33 @@ def extract_zip(zip_path: str, extract_dir: str) -> bool:
         return False
 
 
+def fetch(info: dict) -> bool:
+    """Download (if needed) and extract one entry from DOWNLOADS."""
+    dest_path = os.path.join(RAW_DIR, info["filename"])
+
+    # Skip if already downloaded
+    if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
+        logger.info("Already exists, skipping: %s", dest_path)
+    elif not download_file(info["url"], dest_path, info["description"]):
+        return False
+
+    # Extract zip files
+    if dest_path.endswith(".zip"):
+        return extract_zip(dest_path, RAW_DIR)
+    return True
+
+
 def main():
     os.makedirs(RAW_DIR, exist_ok=True)
-    failures = []
-
-    for key, info in DOWNLOADS.items():
-        dest_path = os.path.join(RAW_DIR, info["filename"])
-
-        # Skip if already downloaded
-        if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
-            logger.info("Already exists, skipping: %s", dest_path)
-        else:
-            success = download_file(info["url"], dest_path, info["description"])
-            if not success:
-                failures.append(key)
-                continue
-
-        # Extract zip files
-        if dest_path.endswith(".zip"):
-            if not extract_zip(dest_path, RAW_DIR):
-                failures.append(key)
+
+    # Downloads are network-bound and independent, so fetch them concurrently;
+    # each task keeps its own retry/backoff loop
+    with ThreadPoolExecutor(max_workers=len(DOWNLOADS)) as executor:
+        futures = {
+            key: executor.submit(fetch, info)
+            for key, info in DOWNLOADS.items()
+        }
+    failures = [key for key, future in futures.items() if not future.result()]
 
     if failures:
         logger.error(
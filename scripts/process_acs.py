@@ -6,13 +6,18 @@ and computes state averages for comparison charts.
 
 Input: scripts/raw/acs_dp05_demographics.csv, acs_dp03_economics.csv
 Output: scripts/processed/acs_demographics.json
+        scripts/processed/acs_demographics.parquet (scalar fields, if pyarrow is installed)
 """
 
-import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
+import numpy as np
+import orjson
 import pandas as pd
 
 logging.basicConfig(
@@ -29,16 +34,79 @@ PROCESSED_DIR = os.path.join(SCRIPT_DIR, "processed")
 ACS_DP05_PATH = os.path.join(RAW_DIR, "acs_dp05_demographics.csv")
 ACS_DP03_PATH = os.path.join(RAW_DIR, "acs_dp03_economics.csv")
 
+# County GEO_ID suffix ('0500000US01001'), bare county FIPS, and the
+# characters stripped from ACS numbers before parsing
+_US_FIPS_RE = re.compile(r"US(\d{5})$")
+_FIPS_RE = re.compile(r"\d{5}")
+_NUM_CLEAN_RE = re.compile(r"[,+%]")
+
+# Column patterns for each field read from DP05/DP03, tried in order by
+# find_column. load_acs_csv parses only the columns these resolve to.
+DP05_PATTERNS = {
+    "geo": ["GEO_ID", "GEOID", "Geography"],
+    "name": ["NAME", "Geographic Area Name"],
+    "population": ["DP05_0001E", "SEX AND AGE!!Total population"],
+    "median_age": ["DP05_0018E", "SEX AND AGE!!Median age"],
+}
+DP03_PATTERNS = {
+    "geo": ["GEO_ID", "GEOID", "Geography"],
+    "median_income": ["DP03_0062E", "INCOME AND BENEFITS!!Median household income"],
+    "household_size": ["DP03_0010E"],
+}
+
+# Scalar county fields written to the Parquet copy read by compute_scores.py
+PARQUET_COLUMNS = [
+    "fips", "name", "state", "population", "medianIncome",
+    "medianAge", "householdSize", "populationGrowth",
+]
 
-def load_acs_csv(path: str) -> pd.DataFrame | None:
-    """Load an ACS CSV file, handling the Census Bureau's dual-header format."""
+
+def read_acs_columns(path: str, usecols: list[str] | None) -> pd.DataFrame:
+    """Read usecols from an ACS CSV as strings, preferring pyarrow's reader."""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        pa_csv = None
+
+    if pa_csv is not None and usecols:
+        try:
+            # Type every column as string up front: letting pyarrow infer
+            # numbers first would strip leading zeros from bare FIPS codes
+            # and rewrite numeric text such as "38.50"
+            table = pa_csv.read_csv(
+                path,
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=usecols,
+                    column_types=dict.fromkeys(usecols, pa.string()),
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.to_pandas()
+        except ValueError as e:
+            logger.info("pyarrow could not parse %s (%s); using the C parser", path, e)
+
+    return pd.read_csv(path, usecols=usecols, dtype=str, low_memory=False)
+
+
+def load_acs_csv(path: str, patterns: dict[str, list[str]]) -> pd.DataFrame | None:
+    """Load the columns of an ACS CSV file that patterns resolve to.
+
+    Handles the Census Bureau's dual-header format.
+    """
     if not os.path.exists(path):
         logger.warning("ACS file not found: %s", path)
         return None
 
     try:
+        # Probe the header so only the columns we use get parsed; if nothing
+        # resolves, read everything so the caller can report the columns
+        columns = column_lookup(pd.read_csv(path, nrows=0))
+        resolved = (find_column(columns, field_patterns) for field_patterns in patterns.values())
+        usecols = list(dict.fromkeys(col for col in resolved if col is not None)) or None
+
         # Census data.census.gov CSVs have a header row and a label row
-        df = pd.read_csv(path, dtype=str, low_memory=False)
+        df = read_acs_columns(path, usecols)
         # If the second row looks like labels (non-numeric), skip it
         if len(df) > 0 and "Label" in str(df.iloc[0].values):
             df = df.iloc[1:].reset_index(drop=True)
@@ -53,10 +121,11 @@ def extract_fips(geo_id: str) -> str | None:
     """Extract 5-digit FIPS from GEO_ID like '0500000US01001'."""
     if not isinstance(geo_id, str):
         return None
-    if "US" in geo_id:
-        return geo_id.split("US")[-1].zfill(5)
+    match = _US_FIPS_RE.search(geo_id)
+    if match:
+        return match.group(1)
     # Already a FIPS code
-    if len(geo_id) == 5 and geo_id.isdigit():
+    if _FIPS_RE.fullmatch(geo_id):
         return geo_id
     return None
 
@@ -81,6 +150,34 @@ STATE_FIPS_TO_ABBR = {
     "56": "WY", "72": "PR",
 }
 
+# The same mapping as an array indexed by integer state FIPS ("" if unknown)
+ABBR_ARR = np.full(100, "", dtype="U2")
+ABBR_ARR[[int(k) for k in STATE_FIPS_TO_ABBR]] = list(STATE_FIPS_TO_ABBR.values())
+
+
+def extract_fips_vec(geo: pd.Series) -> pd.Series:
+    """
+    Vectorized extract_fips over a whole GEO_ID column.
+
+    Only county GEO_IDs ending in 'US' plus five digits, or bare 5-digit
+    codes, yield a FIPS; everything else (nation, state rows) is NaN.
+    """
+    geo = geo.astype(str)
+    plain_fips = geo.where(geo.str.fullmatch(_FIPS_RE))
+    return geo.str.extract(_US_FIPS_RE, expand=False).fillna(plain_fips)
+
+
+def county_rows(geo: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    Vectorized FIPS extraction + state lookup over a whole GEO_ID column.
+
+    Returns (fips, state_abbr) restricted to rows with a 5-digit FIPS; the
+    original index is kept so other columns can be aligned with .loc.
+    """
+    fips = extract_fips_vec(geo).dropna()
+    state_abbr = pd.Series(ABBR_ARR[fips.str[:2].astype(int).to_numpy()], index=fips.index)
+    return fips, state_abbr
+
 
 def process_demographics(dp05: pd.DataFrame | None, dp03: pd.DataFrame | None) -> dict:
     """
@@ -105,77 +202,107 @@ def safe_float(val, default=0.0):
     try:
         if val is None or (isinstance(val, str) and val.strip() in ("", "-", "(X)", "N", "null")):
             return default
-        return float(str(val).replace(",", "").replace("+", "").replace("%", ""))
+        return float(_NUM_CLEAN_RE.sub("", str(val)))
     except (ValueError, TypeError):
         return default
 
 
-def find_column(df: pd.DataFrame, patterns: list[str]) -> str | None:
-    """Find a column matching one of the patterns (case-insensitive partial match)."""
-    cols = list(df.columns)
+def safe_float_series(values: pd.Series, default=0.0) -> pd.Series:
+    """Vectorized safe_float over a whole column.
+
+    Placeholders such as "-", "(X)" and "N" fail numeric parsing and fall
+    back to default, like the scalar version.
+    """
+    cleaned = values.astype(str).str.replace(_NUM_CLEAN_RE, "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(default)
+
+
+def column_lookup(df: pd.DataFrame) -> dict[str, str]:
+    """Map upper-cased column names to the originals, for find_column."""
+    return {col.upper(): col for col in df.columns}
+
+
+def find_column(columns: dict[str, str], patterns: list[str]) -> str | None:
+    """Find a column matching one of the patterns (case-insensitive).
+
+    columns comes from column_lookup(). An exact name match wins; otherwise
+    the first column containing the pattern is returned.
+    """
     for pattern in patterns:
-        for col in cols:
-            if pattern.upper() in col.upper():
+        pattern = pattern.upper()
+        if pattern in columns:
+            return columns[pattern]
+        for upper, col in columns.items():
+            if pattern in upper:
                 return col
     return None
 
 
+def make_empty_county(fips: str, state_abbr: str, name: str = "") -> dict:
+    """Return a fresh county record with every field zeroed."""
+    return {
+        "fips": fips,
+        "name": name,
+        "state": state_abbr,
+        "population": 0,
+        "medianIncome": 0,
+        "medianAge": 0,
+        "householdSize": 0,
+        "populationGrowth": 0,
+        "ageDistribution": {
+            "under18": 0, "age18to34": 0, "age35to54": 0,
+            "age55to74": 0, "age75plus": 0,
+        },
+        "incomeDistribution": {
+            "under25k": 0, "income25kTo50k": 0, "income50kTo75k": 0,
+            "income75kTo100k": 0, "over100k": 0,
+        },
+        "stateAverages": {
+            "medianIncome": 0, "medianAge": 0, "populationPerSqMi": 0,
+        },
+    }
+
+
 def process_dp05(df: pd.DataFrame, counties: dict):
     """Extract population, age distribution from DP05."""
+    columns = column_lookup(df)
+    cols = {field: find_column(columns, patterns) for field, patterns in DP05_PATTERNS.items()}
+
     # Identify GEO_ID column
-    geo_col = find_column(df, ["GEO_ID", "GEOID", "Geography"])
-    name_col = find_column(df, ["NAME", "Geographic Area Name"])
+    geo_col = cols["geo"]
+    name_col = cols["name"]
 
     if geo_col is None:
         logger.warning("Could not find GEO_ID column in DP05. Columns: %s", list(df.columns)[:20])
         return
 
     # Common DP05 variable patterns
-    pop_col = find_column(df, ["DP05_0001E", "SEX AND AGE!!Total population"])
-    median_age_col = find_column(df, ["DP05_0018E", "SEX AND AGE!!Median age"])
-    under18_col = find_column(df, ["DP05_0019E"])
-    age18to34_cols = [find_column(df, [f"DP05_00{i}E"]) for i in range(20, 25)]
-    age35to54_cols = [find_column(df, [f"DP05_00{i}E"]) for i in range(25, 30)]
-    age55to74_cols = [find_column(df, [f"DP05_00{i}E"]) for i in range(30, 35)]
-    age75plus_col = find_column(df, ["DP05_0035E", "DP05_0036E"])
-
-    for _, row in df.iterrows():
-        fips = extract_fips(str(row.get(geo_col, "")))
-        if fips is None or len(fips) != 5:
-            continue
-
-        state_fips = fips_to_state(fips)
-        state_abbr = STATE_FIPS_TO_ABBR.get(state_fips, "")
-
-        name = str(row.get(name_col, "")) if name_col else ""
+    pop_col = cols["population"]
+    median_age_col = cols["median_age"]
+
+    fips_col, state_col = county_rows(df[geo_col])
+    rows = df.loc[fips_col.index]
+
+    if name_col:
+        names = rows[name_col].astype(str)
         # Clean county name: "Autauga County, Alabama" -> "Autauga County"
-        if "," in name:
-            name = name.split(",")[0].strip()
-
-        population = safe_float(row.get(pop_col)) if pop_col else 0
-        median_age = safe_float(row.get(median_age_col)) if median_age_col else 0
-
-        county = counties.setdefault(fips, {
-            "fips": fips,
-            "name": name,
-            "state": state_abbr,
-            "population": 0,
-            "medianIncome": 0,
-            "medianAge": 0,
-            "householdSize": 0,
-            "populationGrowth": 0,
-            "ageDistribution": {
-                "under18": 0, "age18to34": 0, "age35to54": 0,
-                "age55to74": 0, "age75plus": 0,
-            },
-            "incomeDistribution": {
-                "under25k": 0, "income25kTo50k": 0, "income50kTo75k": 0,
-                "income75kTo100k": 0, "over100k": 0,
-            },
-            "stateAverages": {
-                "medianIncome": 0, "medianAge": 0, "populationPerSqMi": 0,
-            },
-        })
+        has_comma = names.str.contains(",", regex=False)
+        names = names.where(~has_comma, names.str.split(",").str[0].str.strip())
+    else:
+        names = pd.Series("", index=rows.index)
+    populations = safe_float_series(rows[pop_col]).tolist() if pop_col else repeat(0)
+    median_ages = safe_float_series(rows[median_age_col]).tolist() if median_age_col else repeat(0)
+
+    for fips, state_abbr, name, population, median_age in zip(
+        fips_col.tolist(),
+        state_col.tolist(),
+        names.tolist(),
+        populations,
+        median_ages,
+    ):
+        county = counties.get(fips)
+        if county is None:
+            county = counties[fips] = make_empty_county(fips, state_abbr, name)
 
         county["population"] = int(population)
         county["medianAge"] = round(median_age, 1)
@@ -189,51 +316,33 @@ def process_dp05(df: pd.DataFrame, counties: dict):
 
 def process_dp03(df: pd.DataFrame, counties: dict):
     """Extract income and economic data from DP03."""
-    geo_col = find_column(df, ["GEO_ID", "GEOID", "Geography"])
+    columns = column_lookup(df)
+    cols = {field: find_column(columns, patterns) for field, patterns in DP03_PATTERNS.items()}
+    geo_col = cols["geo"]
     if geo_col is None:
         logger.warning("Could not find GEO_ID column in DP03. Columns: %s", list(df.columns)[:20])
         return
 
     # DP03 variable patterns
-    median_income_col = find_column(df, ["DP03_0062E", "INCOME AND BENEFITS!!Median household income"])
-    hh_size_col = find_column(df, ["DP03_0010E"])
-
-    # Income distribution columns (percentages)
-    under25k_col = find_column(df, ["DP03_0052E"])  # Less than $10,000
-    # We'll aggregate multiple income brackets if available
-
-    for _, row in df.iterrows():
-        fips = extract_fips(str(row.get(geo_col, "")))
-        if fips is None or len(fips) != 5:
-            continue
-
-        state_fips = fips_to_state(fips)
-        state_abbr = STATE_FIPS_TO_ABBR.get(state_fips, "")
-
-        median_income = safe_float(row.get(median_income_col)) if median_income_col else 0
-        hh_size = safe_float(row.get(hh_size_col)) if hh_size_col else 0
-
-        county = counties.setdefault(fips, {
-            "fips": fips,
-            "name": "",
-            "state": state_abbr,
-            "population": 0,
-            "medianIncome": 0,
-            "medianAge": 0,
-            "householdSize": 0,
-            "populationGrowth": 0,
-            "ageDistribution": {
-                "under18": 0, "age18to34": 0, "age35to54": 0,
-                "age55to74": 0, "age75plus": 0,
-            },
-            "incomeDistribution": {
-                "under25k": 0, "income25kTo50k": 0, "income50kTo75k": 0,
-                "income75kTo100k": 0, "over100k": 0,
-            },
-            "stateAverages": {
-                "medianIncome": 0, "medianAge": 0, "populationPerSqMi": 0,
-            },
-        })
+    median_income_col = cols["median_income"]
+    hh_size_col = cols["household_size"]
+
+    fips_col, state_col = county_rows(df[geo_col])
+    rows = df.loc[fips_col.index]
+    median_incomes = (
+        safe_float_series(rows[median_income_col]).tolist() if median_income_col else repeat(0)
+    )
+    hh_sizes = safe_float_series(rows[hh_size_col]).tolist() if hh_size_col else repeat(0)
+
+    for fips, state_abbr, median_income, hh_size in zip(
+        fips_col.tolist(),
+        state_col.tolist(),
+        median_incomes,
+        hh_sizes,
+    ):
+        county = counties.get(fips)
+        if county is None:
+            county = counties[fips] = make_empty_county(fips, state_abbr)
 
         county["medianIncome"] = int(median_income)
         if hh_size > 0:
@@ -242,30 +351,41 @@ def process_dp03(df: pd.DataFrame, counties: dict):
     logger.info("Processed DP03: updated %d counties with economic data", len(counties))
 
 
+def _group_positive_means(values: np.ndarray, order: np.ndarray, breaks: np.ndarray) -> list:
+    """Per-group mean of the positive values (zero means missing), or NaN if none."""
+    values = values[order]
+    positive = values > 0
+    sums = np.add.reduceat(np.where(positive, values, 0.0), breaks)
+    counts = np.add.reduceat(positive.astype(np.int64), breaks)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan).tolist()
+
+
 def compute_state_averages(counties: dict):
     """Compute state averages for comparison charts."""
-    state_data = {}
-    for fips, county in counties.items():
-        state = county.get("state", "")
-        if not state:
-            continue
-        state_data.setdefault(state, {"incomes": [], "ages": [], "populations": []})
-        if county["medianIncome"] > 0:
-            state_data[state]["incomes"].append(county["medianIncome"])
-        if county["medianAge"] > 0:
-            state_data[state]["ages"].append(county["medianAge"])
-        if county["population"] > 0:
-            state_data[state]["populations"].append(county["population"])
+    states = np.array([county.get("state", "") for county in counties.values()], dtype=object)
+    incomes = np.array([county["medianIncome"] for county in counties.values()], dtype=float)
+    ages = np.array([county["medianAge"] for county in counties.values()], dtype=float)
+    has_state = states != ""
+    states, incomes, ages = states[has_state], incomes[has_state], ages[has_state]
 
     state_averages = {}
-    for state, data in state_data.items():
-        avg_income = sum(data["incomes"]) / len(data["incomes"]) if data["incomes"] else 0
-        avg_age = sum(data["ages"]) / len(data["ages"]) if data["ages"] else 0
-        state_averages[state] = {
-            "medianIncome": round(avg_income),
-            "medianAge": round(avg_age, 1),
-            "populationPerSqMi": 0,  # Would need area data to compute
-        }
+    if len(states):
+        # Sort counties by state (stably, so sums run in county order) and
+        # reduce each contiguous run of one state in a single pass
+        order = np.argsort(states, kind="stable")
+        sorted_states = states[order]
+        breaks = np.flatnonzero(np.r_[True, sorted_states[1:] != sorted_states[:-1]])
+        avg_incomes = _group_positive_means(incomes, order, breaks)
+        avg_ages = _group_positive_means(ages, order, breaks)
+
+        # order[breaks] is each state's first county; keep first-seen order
+        for group in np.argsort(order[breaks]).tolist():
+            avg_income, avg_age = avg_incomes[group], avg_ages[group]
+            state_averages[sorted_states[breaks[group]]] = {
+                "medianIncome": round(avg_income) if pd.notna(avg_income) else 0,
+                "medianAge": round(avg_age, 1) if pd.notna(avg_age) else 0,
+                "populationPerSqMi": 0,  # Would need area data to compute
+            }
 
     # Apply state averages back to each county
     for fips, county in counties.items():
@@ -276,11 +396,29 @@ def compute_state_averages(counties: dict):
     logger.info("Computed state averages for %d states", len(state_averages))
 
 
+def write_demographics_parquet(counties: dict, output_path: str):
+    """Write the scalar county fields as a columnar Parquet table."""
+    if not counties:
+        logger.info("No counties to write, skipping Parquet output")
+        return
+    df = pd.DataFrame.from_dict(counties, orient="index")[PARQUET_COLUMNS]
+    try:
+        df.to_parquet(output_path, index=False, compression="zstd")
+    except ImportError as e:
+        logger.warning("Skipping Parquet output (%s). Install pyarrow to enable it.", e)
+        return
+    logger.info("Wrote ACS demographics Parquet to %s", output_path)
+
+
 def main():
     os.makedirs(PROCESSED_DIR, exist_ok=True)
 
-    dp05 = load_acs_csv(ACS_DP05_PATH)
-    dp03 = load_acs_csv(ACS_DP03_PATH)
+    # The two tables are independent; pandas/pyarrow parse with the GIL
+    # released, so reading them side by side overlaps the work
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dp05_future = executor.submit(load_acs_csv, ACS_DP05_PATH, DP05_PATTERNS)
+        dp03_future = executor.submit(load_acs_csv, ACS_DP03_PATH, DP03_PATTERNS)
+        dp05, dp03 = dp05_future.result(), dp03_future.result()
 
     if dp05 is None and dp03 is None:
         logger.warning(
@@ -291,8 +429,8 @@ def main():
         )
         # Write empty result so downstream scripts don't break
         output_path = os.path.join(PROCESSED_DIR, "acs_demographics.json")
-        with open(output_path, "w") as f:
-            json.dump({}, f)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps({}))
         logger.info("Wrote empty ACS result to %s", output_path)
         sys.exit(0)
 
@@ -306,10 +444,12 @@ def main():
     logger.info("Counties with population: %d, with income: %d", populated, with_income)
 
     output_path = os.path.join(PROCESSED_DIR, "acs_demographics.json")
-    with open(output_path, "w") as f:
-        json.dump(counties, f, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(counties, option=orjson.OPT_INDENT_2))
     logger.info("Wrote ACS demographics to %s", output_path)
 
+    write_demographics_parquet(counties, os.path.join(PROCESSED_DIR, "acs_demographics.parquet"))
+
 
 if __name__ == "__main__":
     main()
@@ -8,11 +8,12 @@ per industry.
 Output: scripts/processed/cbp_by_industry.json
 """
 
-import json
 import logging
 import os
 import sys
 
+import numpy as np
+import orjson
 import pandas as pd
 
 logging.basicConfig(
@@ -33,11 +34,28 @@ CBP_CSV_CANDIDATES = [
     os.path.join(RAW_DIR, "CBP2021.CB2100CBP-Data.csv"),
 ]
 
+# Every column process_cbp_classic knows how to use, across both CBP layouts
+CBP_COLUMNS = {
+    "FIPSTATE", "FIPSCTY", "GEO_ID",
+    "NAICS", "NAICS2017", "NAICS2012",
+    "EST", "ESTAB", "ESTABLISHMENT",
+}
+
+# Columns of the per-(NAICS, county) totals frame from the cbp_totals_* helpers
+TOTALS_COLUMNS = ["NAICS_CLEAN", "FIPS", "EST"]
+
+# Oldest polars with scan_csv(infer_schema=) and collect(engine="streaming")
+POLARS_MIN_VERSION = (1, 25)
+
+# Streaming read sizes: ~500k CBP rows per chunk either way
+CBP_CHUNK_ROWS = 500_000
+CBP_BLOCK_BYTES = 32 * 1024 * 1024
+
 
 def load_industries():
     """Load industry definitions from industries.json."""
-    with open(INDUSTRIES_PATH, "r") as f:
-        industries = json.load(f)
+    with open(INDUSTRIES_PATH, "rb") as f:
+        industries = orjson.loads(f.read())
     logger.info("Loaded %d industry categories from %s", len(industries), INDUSTRIES_PATH)
     return industries
 
@@ -71,71 +89,202 @@ def find_cbp_file():
     return None
 
 
-def process_cbp_classic(cbp_path, naics_map):
-    """Process classic CBP format (cbp21co.txt — pipe or comma delimited)."""
-    # Try reading with different delimiters
+def probe_cbp_header(cbp_path):
+    """Return the delimiter and the columns we use, from the CBP header row."""
+    sep = ","
+    header = pd.read_csv(cbp_path, nrows=0)
+    if len(header.columns) == 1 and "|" in header.columns[0]:
+        sep = "|"
+        header = pd.read_csv(cbp_path, nrows=0, sep=sep)
+    usecols = [c for c in header.columns if c.strip().upper() in CBP_COLUMNS]
+    return sep, usecols
+
+
+def read_cbp_chunks(cbp_path, sep, usecols):
+    """Yield string DataFrame chunks of usecols, preferring pyarrow's streaming reader."""
     try:
-        df = pd.read_csv(cbp_path, dtype=str, low_memory=False)
-    except Exception:
-        df = pd.read_csv(cbp_path, dtype=str, low_memory=False, sep="|")
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        logger.info("pyarrow not installed; reading CBP data with the C parser")
+        yield from pd.read_csv(
+            cbp_path, sep=sep, usecols=usecols, dtype=str, chunksize=CBP_CHUNK_ROWS,
+        )
+        return
+
+    reader = pa_csv.open_csv(
+        cbp_path,
+        read_options=pa_csv.ReadOptions(block_size=CBP_BLOCK_BYTES),
+        parse_options=pa_csv.ParseOptions(delimiter=sep),
+        # Read as strings so FIPS codes keep their leading zeros
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types=dict.fromkeys(usecols, pa.string()),
+            # Empty cells become missing, as with the C parser and polars
+            strings_can_be_null=True,
+        ),
+    )
+    for batch in reader:
+        yield batch.to_pandas()
+
+
+def cbp_totals_pandas(cbp_path, sep, usecols, columns, naics_col, est_col, target_naics):
+    """Sum establishments per (NAICS, county) with pandas, one chunk at a time.
+
+    Peak memory is bounded by the chunk size rather than the whole file.
+    Returns a TOTALS_COLUMNS frame in first-seen (NAICS, county) order.
+    """
+    has_state_county = "FIPSTATE" in columns and "FIPSCTY" in columns
+    chunk_totals = []
+    total_rows = matched_rows = 0
+    for df in read_cbp_chunks(cbp_path, sep, usecols):
+        df.columns = columns
+
+        # Only ~1100 distinct NAICS codes: clean and match the categories once,
+        # then broadcast to rows through the integer codes. Missing values have
+        # code -1, which picks up the trailing False.
+        naics = df[naics_col].astype("category")
+        codes = naics.cat.codes.to_numpy()
+        # CBP NAICS field may have trailing slashes or dashes for ranges
+        clean_categories = naics.cat.categories.str.strip().str.rstrip("/").str.rstrip("-")
+        mask = np.append(clean_categories.isin(target_naics), False)[codes]
+
+        # Everything below only touches the matched rows; derived columns are
+        # kept as standalone arrays so matched is never copied or mutated
+        matched = df.loc[mask]
+        naics_clean = clean_categories.take(codes[mask])
+        total_rows += len(df)
+        matched_rows += len(matched)
+
+        if has_state_county:
+            fips_codes = matched["FIPSTATE"].str.zfill(2) + matched["FIPSCTY"].str.zfill(3)
+        else:
+            # Format: 0500000US01001
+            fips_codes = matched["GEO_ID"].str[-5:]
+
+        # Convert establishment count to numeric; counts fit easily in int32,
+        # and the groupby-sum below accumulates in int64
+        est_counts = pd.to_numeric(matched[est_col], errors="coerce").fillna(0).astype(np.int32)
+
+        # Sum per (NAICS, county) within the chunk
+        chunk_totals.append(
+            est_counts.groupby([naics_clean, fips_codes.to_numpy()], sort=False).sum()
+        )
 
-    logger.info("CBP data loaded: %d rows, columns: %s", len(df), list(df.columns))
+    logger.info("Matched %d rows to target NAICS codes (out of %d total)", matched_rows, total_rows)
+    if not chunk_totals:
+        return pd.DataFrame(columns=TOTALS_COLUMNS)
 
-    # Normalize column names to uppercase
-    df.columns = [c.strip().upper() for c in df.columns]
+    # Merge the per-chunk sums; sort=False keeps first-seen order so the
+    # output key order is unchanged.
+    totals = pd.concat(chunk_totals).groupby(level=[0, 1], sort=False).sum()
+    return totals.rename_axis(TOTALS_COLUMNS[:2]).reset_index(name=TOTALS_COLUMNS[2])
 
-    # Identify FIPS columns
-    if "FIPSTATE" in df.columns and "FIPSCTY" in df.columns:
-        df["FIPS"] = df["FIPSTATE"].str.zfill(2) + df["FIPSCTY"].str.zfill(3)
-    elif "GEO_ID" in df.columns:
-        # Format: 0500000US01001
-        df["FIPS"] = df["GEO_ID"].str[-5:]
+
+def cbp_totals_polars(cbp_path, sep, usecols, columns, naics_col, est_col, target_naics):
+    """Same as cbp_totals_pandas, as a streaming polars query.
+
+    Raises ImportError when polars is missing or older than POLARS_MIN_VERSION,
+    which lacks scan_csv(infer_schema=) and collect(engine="streaming").
+    """
+    import polars as pl
+
+    version = tuple(int(part) for part in pl.__version__.split(".")[:2])
+    if version < POLARS_MIN_VERSION:
+        raise ImportError(
+            f"polars {pl.__version__} is older than "
+            f"{'.'.join(map(str, POLARS_MIN_VERSION))}"
+        )
+
+    if "FIPSTATE" in columns and "FIPSCTY" in columns:
+        fips = pl.col("FIPSTATE").str.zfill(2) + pl.col("FIPSCTY").str.zfill(3)
     else:
-        logger.error("Cannot identify FIPS columns. Available: %s", list(df.columns))
+        # Format: 0500000US01001
+        fips = pl.col("GEO_ID").str.slice(-5)
+
+    agg = (
+        # infer_schema=False reads every column as a string
+        pl.scan_csv(cbp_path, separator=sep, infer_schema=False)
+        .select(pl.col(usecols))
+        .rename(dict(zip(usecols, columns)))
+        # CBP NAICS field may have trailing slashes or dashes for ranges
+        .with_columns(
+            NAICS_CLEAN=pl.col(naics_col).str.strip_chars().str.strip_chars_end("/").str.strip_chars_end("-")
+        )
+        .filter(pl.col("NAICS_CLEAN").is_in(target_naics.tolist()))
+        .with_columns(
+            FIPS=fips,
+            EST=pl.col(est_col).cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int32),
+        )
+        # pandas groupby drops missing keys; polars would keep them as None
+        .filter(pl.col("FIPS").is_not_null())
+        # maintain_order keeps first-seen order so the output key order matches pandas
+        .group_by(["NAICS_CLEAN", "FIPS"], maintain_order=True)
+        # polars sums Int32 as Int32, so widen before summing
+        .agg(pl.col("EST").cast(pl.Int64).sum())
+        .collect(engine="streaming")
+    )
+    logger.info("Aggregated %d (NAICS, county) pairs with polars", agg.height)
+    return pd.DataFrame(agg.to_dict(as_series=False))
+
+
+def process_cbp_classic(cbp_path, naics_map):
+    """Process classic CBP format (cbp21co.txt — pipe or comma delimited)."""
+    sep, usecols = probe_cbp_header(cbp_path)
+    columns = [c.strip().upper() for c in usecols]
+
+    # Identify FIPS columns
+    has_state_county = "FIPSTATE" in columns and "FIPSCTY" in columns
+    if not has_state_county and "GEO_ID" not in columns:
+        logger.error("Cannot identify FIPS columns. Available: %s", columns)
         return None
 
     # Identify NAICS column
     naics_col = None
     for candidate in ["NAICS", "NAICS2017", "NAICS2012"]:
-        if candidate in df.columns:
+        if candidate in columns:
             naics_col = candidate
             break
     if naics_col is None:
-        logger.error("Cannot identify NAICS column. Available: %s", list(df.columns))
+        logger.error("Cannot identify NAICS column. Available: %s", columns)
         return None
 
     # Identify establishment count column
     est_col = None
     for candidate in ["EST", "ESTAB", "ESTABLISHMENT"]:
-        if candidate in df.columns:
+        if candidate in columns:
             est_col = candidate
             break
     if est_col is None:
-        logger.error("Cannot identify establishment column. Available: %s", list(df.columns))
+        logger.error("Cannot identify establishment column. Available: %s", columns)
         return None
 
     logger.info("Using columns: FIPS from FIPSTATE+FIPSCTY, NAICS=%s, EST=%s", naics_col, est_col)
 
-    # Filter to our NAICS codes and aggregate
-    target_naics = set(naics_map.keys())
-    # CBP NAICS field may have trailing slashes or dashes for ranges
-    df["NAICS_CLEAN"] = df[naics_col].str.strip().str.rstrip("/").str.rstrip("-")
-
-    matched = df[df["NAICS_CLEAN"].isin(target_naics)].copy()
-    logger.info("Matched %d rows to target NAICS codes (out of %d total)", len(matched), len(df))
-
-    # Convert establishment count to numeric
-    matched[est_col] = pd.to_numeric(matched[est_col], errors="coerce").fillna(0).astype(int)
+    # Filter to our NAICS codes and sum per (NAICS, county)
+    # Built once and shared by every chunk: an object array is what isin
+    # converts a set to anyway
+    target_naics = np.array(sorted(naics_map), dtype=object)
+    try:
+        totals = cbp_totals_polars(cbp_path, sep, usecols, columns, naics_col, est_col, target_naics)
+    except ImportError as e:
+        logger.info("polars unavailable (%s); aggregating CBP data with pandas", e)
+        totals = cbp_totals_pandas(cbp_path, sep, usecols, columns, naics_col, est_col, target_naics)
+
+    # Fan out to industries with one join. A NAICS code can map to several
+    # industries and an industry has several codes, so re-sum per county.
+    # Inner merges keep left order, so first-seen key order is unchanged.
+    naics_df = pd.DataFrame(
+        [(code, industry_id) for code, ids in naics_map.items() for industry_id in ids],
+        columns=["NAICS_CLEAN", "industry_id"],
+    )
+    joined = totals.merge(naics_df, on="NAICS_CLEAN")
+    by_county = joined.groupby(["industry_id", "FIPS"], sort=False)["EST"].sum().reset_index()
 
     # Build result: {industry_id: {fips: count}}
     result = {}
-    for _, row in matched.iterrows():
-        fips = row["FIPS"]
-        naics = row["NAICS_CLEAN"]
-        est = int(row[est_col])
-        for industry_id in naics_map.get(naics, []):
-            result.setdefault(industry_id, {})
-            result[industry_id][fips] = result[industry_id].get(fips, 0) + est
+    for industry_id, sub in by_county.groupby("industry_id", sort=False):
+        result[industry_id] = dict(zip(sub["FIPS"].tolist(), sub["EST"].tolist()))
 
     return result
 
@@ -156,8 +305,8 @@ def main():
         )
         # Write empty result so downstream scripts don't break
         output_path = os.path.join(PROCESSED_DIR, "cbp_by_industry.json")
-        with open(output_path, "w") as f:
-            json.dump({}, f)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps({}))
         logger.info("Wrote empty CBP result to %s", output_path)
         sys.exit(0)
 
@@ -166,8 +315,8 @@ def main():
         logger.error("Failed to process CBP data. Check column format.")
         # Write empty result
         output_path = os.path.join(PROCESSED_DIR, "cbp_by_industry.json")
-        with open(output_path, "w") as f:
-            json.dump({}, f)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps({}))
         sys.exit(0)
 
     # Log summary
@@ -176,8 +325,8 @@ def main():
         logger.info("  %s: %d counties, %d total establishments", industry_id, len(counties), total_est)
 
     output_path = os.path.join(PROCESSED_DIR, "cbp_by_industry.json")
-    with open(output_path, "w") as f:
-        json.dump(result, f, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     logger.info("Wrote CBP results to %s", output_path)
 
 
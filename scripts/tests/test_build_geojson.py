@@ -0,0 +1,76 @@
+"""Unit tests for build_geojson.py tolerance selection and output."""
+
+import io
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+import pytest
+
+shapely = pytest.importorskip("shapely")
+
+# Add parent directory to path so we can import build_geojson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import build_geojson
+from build_geojson import (
+    MAX_TOLERANCE,
+    MIN_TOLERANCE,
+    pick_tolerance,
+    write_feature_collection,
+)
+
+
+def _circles(count=20, points=400):
+    """Finely-sampled circles that simplify well at coarse tolerances."""
+    angles = np.linspace(0, 2 * np.pi, points, endpoint=False)
+    return np.array([
+        shapely.Polygon(np.column_stack([i * 3 + np.cos(angles), np.sin(angles)]))
+        for i in range(count)
+    ])
+
+
+def test_pick_tolerance_within_budget_keeps_min_tolerance():
+    """Geometries already under budget are returned at MIN_TOLERANCE."""
+    geoms = _circles()
+    budget = int(shapely.get_num_coordinates(geoms).sum())
+    tolerance, simplified = pick_tolerance(geoms, budget)
+    assert tolerance == MIN_TOLERANCE
+    assert simplified is geoms
+
+
+def test_pick_tolerance_fits_budget():
+    """The chosen tolerance brings the vertex count under the budget."""
+    geoms = _circles()
+    budget = int(shapely.get_num_coordinates(geoms).sum()) // 4
+    tolerance, simplified = pick_tolerance(geoms, budget)
+    assert MIN_TOLERANCE < tolerance <= MAX_TOLERANCE
+    assert shapely.get_num_coordinates(simplified).sum() <= budget
+
+
+def test_pick_tolerance_over_budget_at_max_tolerance_warns(caplog):
+    """An unreachable budget returns the MAX_TOLERANCE result and logs a warning."""
+    geoms = _circles()
+    with caplog.at_level(logging.WARNING, logger="build_geojson"):
+        tolerance, simplified = pick_tolerance(geoms, vertex_budget=10)
+    assert tolerance == MAX_TOLERANCE
+    assert shapely.get_num_coordinates(simplified).sum() > 10
+    assert "over the 10-vertex budget" in caplog.text
+
+
+def test_write_feature_collection_across_blocks(monkeypatch):
+    """Features split over several encoding blocks form one valid collection."""
+    monkeypatch.setattr(build_geojson, "GEOJSON_BLOCK", 3)
+    geoms = _circles(count=7, points=8)
+    geoids = [f"01{i:03d}" for i in range(7)]
+    names = [f"County {i}" for i in range(7)]
+
+    f = io.BytesIO()
+    size, count = write_feature_collection(f, geoids, names, ["01"] * 7, geoms)
+
+    assert (size, count) == (len(f.getvalue()), 7)
+    features = json.loads(f.getvalue())["features"]
+    assert [feat["properties"]["GEOID"] for feat in features] == geoids
+    assert features[6]["geometry"] == json.loads(shapely.to_geojson(geoms[6]))
@@ -3,6 +3,8 @@
 import sys
 import os
 
+import pandas as pd
+
 # Add parent directory to path so we can import compute_scores
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -10,6 +12,7 @@ from compute_scores import (
     normalize_scores,
     compute_capped_score,
     compute_industry_scores,
+    build_county_arrays,
 )
 
 
@@ -152,6 +155,86 @@ def test_output_matches_typescript_interface():
     assert isinstance(county["populationPerBiz"], (int, float))
 
 
+def test_precomputed_county_arrays_match_on_the_fly():
+    """Scores match reference values whether county arrays are prebuilt or not."""
+    demographics = {
+        "01001": {"population": 50000, "medianIncome": 50000, "populationGrowth": 1.5,
+                  "name": "County A", "state": "AL"},
+        "01003": {"population": 100000, "medianIncome": 0, "populationGrowth": -0.5,
+                  "name": "County B", "state": "AL"},
+        "01005": {"population": 24000, "medianIncome": 38000, "populationGrowth": 0.5,
+                  "name": "County D", "state": "AL"},
+        "06001": {"population": 160000, "medianIncome": 90000, "populationGrowth": 2.0,
+                  "name": "County E", "state": "CA"},
+        "06037": {"population": 0, "medianIncome": 70000, "populationGrowth": 1.0,
+                  "name": "County C", "state": "CA"},
+        "99001": {"population": 1000, "medianIncome": 40000, "populationGrowth": 0.0,
+                  "name": "Invalid", "state": ""},
+    }
+    cbp_data = {"test-industry": {"01001": 10, "01005": 3, "06001": 20, "06037": 4}}
+
+    # (score, establishmentCount, populationPerBiz) as produced by the
+    # original per-county loop; 01003 has no establishments and gets the
+    # 95th-percentile cap of 8000
+    expected = {
+        "01001": (0, 10, 5000),
+        "01003": (29, 0, 8000),
+        "01005": (39, 3, 8000),
+        "06001": (100, 20, 8000),
+    }
+
+    county_arrays = build_county_arrays(demographics)
+    for arrays in (None, county_arrays):
+        scores = compute_industry_scores("test-industry", cbp_data, demographics, arrays)
+        # Only valid FIPS with population are scored
+        assert {
+            fips: (c["score"], c["establishmentCount"], c["populationPerBiz"])
+            for fips, c in scores.items()
+        } == expected
+
+
+def test_cbp_only_counties_widen_growth_range():
+    """Valid FIPS only in CBP enter the growth range as zero growth."""
+    demographics = {
+        "01001": {"population": 1000, "medianIncome": 0, "populationGrowth": 3.0},
+        "01003": {"population": 2000, "medianIncome": 0, "populationGrowth": 1.0},
+        "01005": {"population": 3000, "medianIncome": 0, "populationGrowth": 2.0},
+    }
+    counts = {"01001": 1, "01003": 1, "01005": 1}
+
+    # Growth normalized over [1, 3]: raw scores 1200, 2000, 3300
+    scores = compute_industry_scores("test-industry", {"test-industry": counts}, demographics)
+    assert [scores[f]["score"] for f in ("01001", "01003", "01005")] == [0, 38, 100]
+
+    # 06001 has no demographics, so growth is normalized over [0, 3]:
+    # raw scores 1200, 2133.3, 3400
+    cbp_data = {"test-industry": {**counts, "06001": 5}}
+    scores = compute_industry_scores("test-industry", cbp_data, demographics)
+    assert set(scores) == {"01001", "01003", "01005"}
+    assert [scores[f]["score"] for f in ("01001", "01003", "01005")] == [0, 42, 100]
+
+
+def test_county_arrays_from_frame_match_dict():
+    """A columnar demographics frame scores the same as the FIPS-keyed dict."""
+    demographics = {
+        "01001": {"fips": "01001", "population": 50000, "medianIncome": 50000,
+                  "populationGrowth": 1.5, "name": "County A", "state": "AL"},
+        "06037": {"fips": "06037", "population": 200000, "medianIncome": 70000,
+                  "populationGrowth": -0.5, "name": "County C", "state": "CA"},
+        "99001": {"fips": "99001", "population": 1000, "medianIncome": 40000,
+                  "populationGrowth": 0.0, "name": "Invalid", "state": ""},
+    }
+    frame = pd.DataFrame(list(demographics.values()))
+    cbp_data = {"test-industry": {"01001": 10, "06037": 4}}
+
+    expected = compute_industry_scores("test-industry", cbp_data, demographics)
+    scores = compute_industry_scores(
+        "test-industry", cbp_data, frame, build_county_arrays(frame),
+    )
+
+    assert scores == expected
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,120 @@
+"""Unit tests for process_acs.py county extraction and output."""
+
+import sys
+import os
+
+import orjson
+import pandas as pd
+
+# Add parent directory to path so we can import process_acs
+from process_acs import compute_state_averages, county_rows, extract_fips_vec, make_empty_county
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import process_acs
+from process_acs import compute_state_averages, county_rows, extract_fips_vec, make_empty_county
+
+
+def test_extract_fips_vec_keeps_only_county_geo_ids():
+    """Nation and state GEO_IDs yield no FIPS; county and bare codes do."""
+    geo = pd.Series([
+        "0500000US01001", "0100000US", "0400000US01", "06037", "1001", "Label",
+    ])
+    fips = extract_fips_vec(geo)
+
+    assert fips.dropna().to_dict() == {0: "01001", 3: "06037"}
+
+
+def test_county_rows_drops_non_county_rows_and_keeps_index():
+    """county_rows keeps the original index of county rows for .loc alignment."""
+    geo = pd.Series(
+        ["0100000US", "0400000US01", "0500000US01001", "0500000US72153"],
+        index=[10, 11, 12, 13],
+    )
+    fips, state_abbr = county_rows(geo)
+
+    assert fips.to_dict() == {12: "01001", 13: "72153"}
+    assert state_abbr.to_dict() == {12: "AL", 13: "PR"}
+
+
+def _county(fips, state, income, age):
+    """A zeroed county record with the fields state averages read."""
+    county = make_empty_county(fips, state)
+    county["medianIncome"] = income
+    county["medianAge"] = age
+    return county
+
+
+def test_state_averages_skip_zero_values():
+    """Zero means missing, so it is left out of the state mean."""
+    counties = {
+        "01001": _county("01001", "AL", 50000, 40.0),
+        "01003": _county("01003", "AL", 0, 0),
+        "01005": _county("01005", "AL", 60001, 35.5),
+    }
+    compute_state_averages(counties)
+
+    for county in counties.values():
+        assert county["stateAverages"] == {
+            "medianIncome": 55000, "medianAge": 37.8, "populationPerSqMi": 0,
+        }
+
+
+def test_state_without_positive_values_averages_to_zero():
+    """A state whose counties are all missing a value averages it to 0."""
+    counties = {
+        "02013": _county("02013", "AK", 0, 0),
+        "02016": _county("02016", "AK", 0, 31.0),
+    }
+    compute_state_averages(counties)
+
+    assert counties["02013"]["stateAverages"] == {
+        "medianIncome": 0, "medianAge": 31.0, "populationPerSqMi": 0,
+    }
+
+
+def test_state_averages_follow_interleaved_states():
+    """Each county gets its own state's averages, whatever the key order."""
+    counties = {
+        "06037": _county("06037", "CA", 80000, 36.0),
+        "01001": _county("01001", "AL", 50000, 40.0),
+        "06001": _county("06001", "CA", 90000, 38.0),
+        "48201": _county("48201", "TX", 0, 0),
+        "01003": _county("01003", "AL", 40000, 42.0),
+        "99999": _county("99999", "", 10000, 10.0),
+    }
+    compute_state_averages(counties)
+
+    averages = {fips: county["stateAverages"] for fips, county in counties.items()}
+    assert list(averages) == ["06037", "01001", "06001", "48201", "01003", "99999"]
+    assert averages["06037"] == averages["06001"] == {
+        "medianIncome": 85000, "medianAge": 37.0, "populationPerSqMi": 0,
+    }
+    assert averages["01001"] == averages["01003"] == {
+        "medianIncome": 45000, "medianAge": 41.0, "populationPerSqMi": 0,
+    }
+    assert averages["48201"] == {"medianIncome": 0, "medianAge": 0, "populationPerSqMi": 0}
+    # Counties without a state keep their zeroed defaults
+    assert averages["99999"] == make_empty_county("99999", "")["stateAverages"]
+
+
+def test_main_without_county_rows_writes_empty_output(tmp_path, monkeypatch):
+    """A DP05 table with only nation/state rows exits cleanly with no counties."""
+    dp05_path = tmp_path / "dp05.csv"
+    dp05_path.write_text(
+        "GEO_ID,NAME,DP05_0001E\n"
+        "0100000US,United States,331449520\n"
+        "0400000US01,Alabama,5028092\n"
+    )
+    monkeypatch.setattr(process_acs, "ACS_DP05_PATH", str(dp05_path))
+    monkeypatch.setattr(process_acs, "ACS_DP03_PATH", str(tmp_path / "missing.csv"))
+    monkeypatch.setattr(process_acs, "PROCESSED_DIR", str(tmp_path))
+
+    process_acs.main()
+
+    assert orjson.loads((tmp_path / "acs_demographics.json").read_bytes()) == {}
+    assert not (tmp_path / "acs_demographics.parquet").exists()
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
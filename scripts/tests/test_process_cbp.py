@@ -0,0 +1,110 @@
+"""Unit tests for process_cbp.py aggregation backends."""
+
+import builtins
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add parent directory to path so we can import process_cbp
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import process_cbp
+
+CBP_ROWS = """FIPSTATE,FIPSCTY,NAICS,EST
+01,001,722515,5
+01,003,722515/,3
+01,003,812910,
+06,037,812910-,4
+06,037,999999,50
+1,3,812910,6
+01,001,812910,1
+06,037,812911,2
+01,001,722515,2
+"""
+
+# 812910 feeds two industries and pets has two codes
+NAICS_MAP = {
+    "722515": ["coffee-shops"],
+    "812910": ["pet-grooming", "pets"],
+    "812911": ["pets"],
+}
+
+EXPECTED = {
+    "coffee-shops": {"01001": 7, "01003": 3},
+    "pet-grooming": {"01003": 6, "06037": 4, "01001": 1},
+    "pets": {"01003": 6, "06037": 6, "01001": 1},
+}
+
+
+@pytest.fixture
+def cbp_path(tmp_path, monkeypatch):
+    """A small CBP file read a few rows at a time, so chunk sums get merged."""
+    path = tmp_path / "cbp21co.txt"
+    path.write_text(CBP_ROWS)
+    monkeypatch.setattr(process_cbp, "CBP_CHUNK_ROWS", 2)
+    monkeypatch.setattr(process_cbp, "CBP_BLOCK_BYTES", 40)
+    return str(path)
+
+
+def _hide_module(monkeypatch, module):
+    """Make process_cbp see module as not installed.
+
+    Only imports made from process_cbp fail: pandas itself uses pyarrow
+    for its string columns when it is installed.
+    """
+    real_import = builtins.__import__
+
+    def fake_import(name, globals=None, *args, **kwargs):
+        if name.split(".")[0] == module and (globals or {}).get("__name__") == "process_cbp":
+            raise ImportError(f"No module named {module!r}")
+        return real_import(name, globals, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+
+
+def _ordered(result):
+    """Industry and county key order is part of the output, so compare it too."""
+    return [(industry_id, list(counties.items())) for industry_id, counties in result.items()]
+
+
+def test_polars_backend(cbp_path):
+    pytest.importorskip("polars")
+    result = process_cbp.process_cbp_classic(cbp_path, NAICS_MAP)
+    assert _ordered(result) == _ordered(EXPECTED)
+
+
+def test_pandas_backend_with_pyarrow(cbp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    _hide_module(monkeypatch, "polars")
+    result = process_cbp.process_cbp_classic(cbp_path, NAICS_MAP)
+    assert _ordered(result) == _ordered(EXPECTED)
+
+
+def test_pandas_backend_without_pyarrow(cbp_path, monkeypatch):
+    _hide_module(monkeypatch, "polars")
+    _hide_module(monkeypatch, "pyarrow")
+    result = process_cbp.process_cbp_classic(cbp_path, NAICS_MAP)
+    assert _ordered(result) == _ordered(EXPECTED)
+
+
+def test_backends_return_same_totals(cbp_path, monkeypatch):
+    pytest.importorskip("polars")
+    sep, usecols = process_cbp.probe_cbp_header(cbp_path)
+    columns = [c.strip().upper() for c in usecols]
+    target_naics = np.array(sorted(NAICS_MAP), dtype=object)
+    args = (cbp_path, sep, usecols, columns, "NAICS", "EST", target_naics)
+
+    polars_totals = process_cbp.cbp_totals_polars(*args)
+    pandas_totals = process_cbp.cbp_totals_pandas(*args)
+    _hide_module(monkeypatch, "pyarrow")
+    c_parser_totals = process_cbp.cbp_totals_pandas(*args)
+
+    expected = polars_totals.to_dict("records")
+    assert pandas_totals.to_dict("records") == expected
+    assert c_parser_totals.to_dict("records") == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])